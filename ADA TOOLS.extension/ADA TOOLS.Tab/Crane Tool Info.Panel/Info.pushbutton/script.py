@@ -1,8 +1,5 @@
-from pydoc import __author__
-
-
 __file__ == "Import your CSV file of a Crane Diagram"
-__author__ == "Almog Davidson"
+__author__ = "Almog Davidson"
 __doc__ == "This an import CSV file. Units Must be in centimeter. Separator must be comma (,)"
 
 
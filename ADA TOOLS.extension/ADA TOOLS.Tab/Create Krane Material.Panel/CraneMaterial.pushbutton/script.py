@@ -12,13 +12,10 @@ wall_collector = DB.FilteredElementCollector(doc)\
                    .WhereElementIsNotElementType()
 
 
-# Iterate over wall and collect Volume data
-total_volume = 0.0
-
-for wall in wall_collector:
-    vol_param = wall.Parameter[DB.BuiltInParameter.HOST_VOLUME_COMPUTED]
-    if vol_param:
-        total_volume = total_volume + vol_param.AsDouble()
+# Collect Volume data of every wall and sum it in a single reduction
+volume_bip = DB.BuiltInParameter.HOST_VOLUME_COMPUTED
+vol_params = (wall.Parameter[volume_bip] for wall in wall_collector)
+total_volume = sum((vol_param.AsDouble() for vol_param in vol_params if vol_param), 0.0)
 
 # now that results are collected, print the total
 print("Total Volume is: {}".format(total_volume))
\ No newline at end of file
@@ -27,76 +27,52 @@ Author:     Almog Davidson"""
 
 
 #IMPORTS
-import os
-import sys
-import Autodesk
-from Autodesk.Revit.UI import *
-from Autodesk.Revit.DB import *
-from Autodesk.Revit.UI.Selection import ObjectType
-from pyrevit import revit, forms
+from System.Collections.Generic import List
+from Autodesk.Revit.DB import BuiltInCategory, Document, ElementMulticategoryFilter
+from Autodesk.Revit.Exceptions import OperationCanceledException
+from Autodesk.Revit.UI.Selection import ISelectionFilter, ObjectType
+from pyrevit import script
 
 #VARIABLES
 uidoc     = __revit__.ActiveUIDocument
 doc       = __revit__.ActiveUIDocument.Document #type: Document
 
 # CLASS
-class Mult_Category1(Selection.ISelectionFilter):
-	def __init__(self, nom_categorie_1, nom_categorie_2, nom_categorie_3, nom_categorie_4):
-		self.nom_categorie_1 = nom_categorie_1
-		self.nom_categorie_2 = nom_categorie_2
-		self.nom_categorie_3 = nom_categorie_3
-		self.nom_categorie_4 = nom_categorie_4
+class Mult_Category(ISelectionFilter):
+	def __init__(self, *categories):
+		self.filtre_categories = ElementMulticategoryFilter(List[BuiltInCategory](categories))
 
 	def AllowElement(self, e):
-		if e.Category.Name == self.nom_categorie_1 or e.Category.Name == self.nom_categorie_2 or e.Category.Name == self.nom_categorie_3 or e.Category.Name == self.nom_categorie_4:
-			return True
-		else:
-			return False
-	def AllowReference(self, ref, point):
-		return True
-
-class Mult_Category2(Selection.ISelectionFilter):
-	def __init__(self, nom_categorie_1, nom_categorie_2):
-		self.nom_categorie_1 = nom_categorie_1
-		self.nom_categorie_2 = nom_categorie_2
-
-	def AllowElement(self, e):
-		if e.Category.Name == self.nom_categorie_1 or e.Category.Name == self.nom_categorie_2 :
-			return True
-		else:
-			return False
+		return self.filtre_categories.PassesFilter(e)
 	def AllowReference(self, ref, point):
 		return True
 
 #SELECT SURFACE ELEMENT
 # Prompt the user to select multiple elements
 try:
-    selection1 = uidoc.Selection.PickObjects(ObjectType.Element,  Mult_Category1('Structural Columns', 'Floors', 'Structural Framing','Walls'))
-except Exception as e:
+    selection1 = uidoc.Selection.PickObjects(ObjectType.Element,  Mult_Category(BuiltInCategory.OST_StructuralColumns, BuiltInCategory.OST_Floors, BuiltInCategory.OST_StructuralFraming, BuiltInCategory.OST_Walls))
+except OperationCanceledException:
     print("Selection canceled.")
-    selection = None
+    selection1 = None
 
-# Check if the user made a selection
+# Check if the user made a selection, stop here otherwise
 if not selection1:
     print("No elements selected.")
+    script.exit()
 else:
     # Create a list to store element IDs
     element_ids_1 = []
-    elements_1 = []
 
     # Loop through the selected elements to retrieve their IDs
     for sel in selection1:
-        # Get the element by its Reference
-        element = doc.GetElement(sel.ElementId)
-        if element:
-            # Append the ElementId's IntegerValue (the actual ID number)
-            element_ids_1.append(sel.ElementId.IntegerValue)
+        # Append the ElementId's IntegerValue (the actual ID number)
+        element_ids_1.append(sel.ElementId.IntegerValue)
 
 #SELECT INTERSECTING ELEMENT
 # Second selection: Prompt the user to select a second set of elements from allowed categories
 try:
-    selection2 = uidoc.Selection.PickObjects(ObjectType.Element, Mult_Category2('Pipes','Ducts'))
-except Exception as e:
+    selection2 = uidoc.Selection.PickObjects(ObjectType.Element, Mult_Category(BuiltInCategory.OST_PipeCurves, BuiltInCategory.OST_DuctCurves))
+except OperationCanceledException:
     print("Second selection canceled.")
     selection2 = None
 
@@ -106,15 +82,11 @@ if not selection2:
 else:
     # Create a list to store the second set of element IDs
     element_ids_2 = []
-    elements_2 = []
 
     # Loop through the second set of selected elements to retrieve their IDs
     for sel in selection2:
-        # Get the element by its Reference
-        element = doc.GetElement(sel.ElementId)
-        if element:
-            # Append the ElementId's IntegerValue (the actual ID number)
-            element_ids_2.append(sel.ElementId.IntegerValue)
+        # Append the ElementId's IntegerValue (the actual ID number)
+        element_ids_2.append(sel.ElementId.IntegerValue)
 
     # Print the second set of selected element IDs
     print("Selected Element IDs:", element_ids_1)
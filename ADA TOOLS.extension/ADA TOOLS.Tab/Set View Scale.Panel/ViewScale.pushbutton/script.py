@@ -1,15 +1,20 @@
 #Imports
-import sys
-from Autodesk.Revit.DB import (Transaction)
+from Autodesk.Revit.DB import (BuiltInParameter, Transaction)
 
 #Variables
 doc = __revit__.ActiveUIDocument.Document
 view = doc.ActiveView
-t = Transaction(doc,'change scale')
+scale_param = view.get_Parameter(BuiltInParameter.VIEW_SCALE)
 
 #Main
-t.Start()
+# Sheets, schedules, perspective views or views under a template can't change scale
+if scale_param is None or scale_param.IsReadOnly:
+    print("The scale of this view can't be changed.")
+# Skip the transaction (and its undo entry) when the scale is already set
+elif view.Scale != 50:
+    t = Transaction(doc,'change scale')
+    t.Start()
 
-view.Scale = 50
+    view.Scale = 50
 
-t.Commit()
\ No newline at end of file
+    t.Commit()
\ No newline at end of file
@@ -1,29 +1,38 @@
 import clr
 clr.AddReference("RevitServices")
 clr.AddReference("RevitAPI")
-clr.AddReference("RevitNodes")
 
 from RevitServices.Persistence import DocumentManager
-from Autodesk.Revit.DB import FilteredElementCollector, ElementIntersectsElementFilter
+from Autodesk.Revit.DB import BoundingBoxIntersectsFilter, ElementId, ElementIntersectsElementFilter, Outline
 
 # Get the active document
 doc = DocumentManager.Instance.CurrentDBDocument
 
 # Define a function to check for intersection between two elements
 def elements_intersect(element1_id, element2_id):
-    # Get elements by their IDs
-    element1 = doc.GetElement(element1_id)
+    # Only the second element is needed to build the filters
     element2 = doc.GetElement(element2_id)
+    if element2 is None:
+        raise ValueError("Element {} not found in the document.".format(element2_id.IntegerValue))
+    
+    # Cheap bounding box test first: if the boxes don't overlap,
+    # skip the geometric intersection test entirely
+    bbox = element2.get_BoundingBox(None)
+    if bbox is not None:
+        bbox_filter = BoundingBoxIntersectsFilter(Outline(bbox.Min, bbox.Max))
+        if not bbox_filter.PassesFilter(doc, element1_id):
+            return False
     
     # Create an ElementIntersectsElementFilter
     intersection_filter = ElementIntersectsElementFilter(element2)
     
     # Check if the first element intersects with the second element
-    return intersection_filter.PassesFilter(element1)
+    # (PassesFilter(doc, id) tests it by id, without fetching the element)
+    return intersection_filter.PassesFilter(doc, element1_id)
 
 # Example element IDs (replace with actual IDs from your Revit model)
-element1_id = 12345  # Replace with the actual element ID
-element2_id = 67890  # Replace with the actual element ID
+element1_id = ElementId(12345)  # Replace with the actual element ID
+element2_id = ElementId(67890)  # Replace with the actual element ID
 
 # Call the function and print the result
 if elements_intersect(element1_id, element2_id):